@@ -1,3 +1,5 @@
+import re
+
 from nonebot import get_driver, require
 
 driver = get_driver()
@@ -6,7 +8,6 @@ from nonebot.permission import SUPERUSER
 from nonebot.plugin import PluginMetadata
 from nonebot_plugin_alconna.uniseg import MsgTarget, UniMessage
 
-from zhenxun.configs.config import Config
 from zhenxun.configs.utils import PluginCdBlock, PluginExtraData, RegisterConfig
 from zhenxun.services.log import logger
 from zhenxun.utils.enum import LimitWatchType, PluginLimitType
@@ -30,62 +31,104 @@ from nonebot_plugin_alconna import (
     on_alconna,
 )
 
-base_config = Config.get("summary_group")
-
-from .config import summary_config  # noqa: F401
+from .config import base_config, get_summary_limits, summary_config  # noqa: F401
 
 
 def validate_msg_count_range(count: int) -> int:
     """验证消息数量是否在配置的范围内"""
-    logger.debug(f"--- 验证器 validate_msg_count_range 被调用，输入参数: {count} ---")
+    limits = get_summary_limits()
+    if not (limits.min_length <= count <= limits.max_length):
+        logger.warning(
+            f"消息数量验证失败: {count} 不在范围 [{limits.min_length}, {limits.max_length}] 内"
+        )
+        raise ValueError(limits.range_error)
 
-    min_len_val = base_config.get("SUMMARY_MIN_LENGTH")
-    max_len_val = base_config.get("SUMMARY_MAX_LENGTH")
+    return count
 
-    if min_len_val is None or max_len_val is None:
-        logger.error(
-            "配置缺失: SUMMARY_MIN_LENGTH 或 SUMMARY_MAX_LENGTH 未在配置中找到或为 null。"
-        )
-        raise ValueError("配置错误: 缺少最小/最大消息长度设置。")
 
-    try:
-        min_len_int = int(min_len_val)
-        max_len_int = int(max_len_val)
-    except (ValueError, TypeError):
-        logger.error("配置值 SUMMARY_MIN_LENGTH 或 SUMMARY_MAX_LENGTH 不是有效整数。")
-        raise ValueError("配置错误: 最小/最大消息长度不是有效整数。")
+TIME_REGEX = re.compile(r"(\d+):(\d+)|(\d{1,2}?)(\d{2})?")
+"""匹配 H:M 形式或 HHMM、HMM、H/HH 纯数字形式，需配合 fullmatch 使用，取值范围另行校验"""
 
-    if not (min_len_int <= count <= max_len_int):
-        logger.warning(
-            f"消息数量验证失败: {count} 不在范围 [{min_len_int}, {max_len_int}] 内"
-        )
-        raise ValueError(f"总结消息数量应在 {min_len_int} 到 {max_len_int} 之间")
 
-    return count
+def parse_time(time_str: str) -> tuple[int, int]:
+    if not isinstance(time_str, str):
+        raise ValueError(f"输入必须是字符串，而不是 {type(time_str)}")
 
+    time_str = time_str.strip()
+    if not time_str:
+        raise ValueError("时间字符串不能为空")
 
-def parse_and_validate_time(time_str: str) -> tuple[int, int]:
-    logger.debug(f"--- parse_and_validate_time 被调用，输入参数: {time_str!r} ---")
+    match = TIME_REGEX.fullmatch(time_str)
+    if not match:
+        if ":" in time_str:
+            if time_str.count(":") != 1:
+                raise ValueError("冒号格式必须为 HH:MM")
+            raise ValueError("HH:MM 格式中包含非数字或空部分")
+        if time_str.isdigit():
+            raise ValueError("纯数字格式必须为 HHMM、HMM 或 H/HH")
+        raise ValueError("时间格式无法识别，请使用 HH:MM 或 HHMM")
 
-    try:
-        from .handlers.scheduler import parse_time
+    if match.group(1) is not None:
+        hour_str, minute_str = match.group(1, 2)
+    else:
+        hour_str, minute_str = match.group(3, 4)
+    hour = int(hour_str)
+    minute = int(minute_str or 0)
 
-        result = parse_time(time_str)
-        logger.debug(
-            f"parse_and_validate_time 执行成功，结果: {result[0]:02d}:{result[1]:02d}"
-        )
-        return result
+    if not (0 <= hour <= 23):
+        raise ValueError(f"小时 {hour} 超出有效范围 (0-23)")
+    if not (0 <= minute <= 59):
+        raise ValueError(f"分钟 {minute} 超出有效范围 (0-59)")
+    return hour, minute
 
+
+def parse_and_validate_time(time_str: str) -> tuple[int, int]:
+    try:
+        return parse_time(time_str)
     except ValueError as e:
-        logger.error(f"parse_and_validate_time 执行失败: {e}", e=e)
+        logger.warning(f"时间验证失败: {e}")
         raise
-
     except Exception as e:
         logger.error(f"parse_and_validate_time 意外错误: {e}", e=e)
-        raise ValueError(f"解析时间时发生意外错误: {e}")
+        raise ValueError(f"解析时间时发生意外错误: {e}") from e
 
 
-TIME_REGEX = r"(0?[0-9]|1[0-9]|2[0-3]):([0-5][0-9])|(0?[0-9]|1[0-9]|2[0-3])([0-5][0-9])"
+_min_length = base_config.get("SUMMARY_MIN_LENGTH", 1)
+_max_length = base_config.get("SUMMARY_MAX_LENGTH", 1000)
+_cool_down = base_config.get("SUMMARY_COOL_DOWN", 60)
+
+_CONFIG_SPECS = (
+    # (key, 默认值, 说明, 类型)
+    (
+        "MESSAGE_CACHE_TTL_SECONDS",
+        300,
+        "获取的消息列表缓存时间（秒），0表示禁用缓存，每次都实时获取。",
+        int,
+    ),
+    ("SUMMARY_MAX_LENGTH", 1000, "手动触发总结时，默认获取的最大消息数量", int),
+    ("SUMMARY_MIN_LENGTH", 50, "触发总结所需的最少消息数量", int),
+    ("SUMMARY_COOL_DOWN", 60, "用户手动触发总结的冷却时间（秒，0表示无冷却）", int),
+    ("summary_output_type", "image", "总结输出类型 (image 或 text)", str),
+    ("summary_fallback_enabled", False, "当图片生成失败时是否自动回退到文本模式", bool),
+    ("summary_theme", "dark", "总结图片输出的主题 (可选: light, dark, cyber)", str),
+    ("EXCLUDE_BOT_MESSAGES", False, "是否在总结时排除 Bot 自身发送的消息", bool),
+    ("USE_DB_HISTORY", False, "是否尝试从数据库(chat_history表)读取聊天记录", bool),
+    (
+        "SUMMARY_MODEL_NAME",
+        "Gemini/gemini-2.5-flash",
+        "默认使用的 AI 模型名称 (格式: ProviderName/ModelName)",
+        str,
+    ),
+    ("SUMMARY_DEFAULT_STYLE", None, "全局默认的总结风格，会被分群设置覆盖。", str),
+    ("ENABLE_AVATAR_ENHANCEMENT", True, "是否启用头像增强功能", bool),
+    (
+        "SUMMARY_RESULT_CACHE_SECONDS",
+        60,
+        "相同总结请求复用 AI 生成结果的时间（秒），0表示禁用，每次都重新生成。",
+        int,
+    ),
+    ("SUMMARY_LLM_RPM", 0, "每个模型每分钟最多发起的总结请求数，0表示不限制", int),
+)
 
 
 __plugin_meta__ = PluginMetadata(
@@ -117,8 +160,8 @@ __plugin_meta__ = PluginMetadata(
         "  `总结风格 设置 <风格>` - 设置插件的全局默认风格\n"
         "  `总结风格 移除` - 移除插件的全局默认风格\n\n"
         "ℹ️ **说明**\n"
-        f"  • 消息数量范围: {base_config.get('SUMMARY_MIN_LENGTH', 1)}-{base_config.get('SUMMARY_MAX_LENGTH', 1000)}\n"
-        f"  • 手动总结冷却: {base_config.get('SUMMARY_COOL_DOWN', 60)}秒"
+        f"  • 消息数量范围: {_min_length}-{_max_length}\n"
+        f"  • 手动总结冷却: {_cool_down}秒"
     ),
     type="application",
     homepage="https://github.com/webjoin111/zhenxun_plugin_summary_group",
@@ -129,104 +172,17 @@ __plugin_meta__ = PluginMetadata(
         configs=[
             RegisterConfig(
                 module="summary_group",
-                key="MESSAGE_CACHE_TTL_SECONDS",
-                value=300,
-                help="获取的消息列表缓存时间（秒），0表示禁用缓存，每次都实时获取。",
-                default_value=300,
-                type=int,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="SUMMARY_MAX_LENGTH",
-                value=1000,
-                help="手动触发总结时，默认获取的最大消息数量",
-                default_value=1000,
-                type=int,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="SUMMARY_MIN_LENGTH",
-                value=50,
-                help="触发总结所需的最少消息数量",
-                default_value=50,
-                type=int,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="SUMMARY_COOL_DOWN",
-                value=60,
-                help="用户手动触发总结的冷却时间（秒，0表示无冷却）",
-                default_value=60,
-                type=int,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="summary_output_type",
-                value="image",
-                help="总结输出类型 (image 或 text)",
-                default_value="image",
-                type=str,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="summary_fallback_enabled",
-                value=False,
-                help="当图片生成失败时是否自动回退到文本模式",
-                default_value=False,
-                type=bool,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="summary_theme",
-                value="dark",
-                help="总结图片输出的主题 (可选: light, dark, cyber)",
-                default_value="dark",
-                type=str,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="EXCLUDE_BOT_MESSAGES",
-                value=False,
-                help="是否在总结时排除 Bot 自身发送的消息",
-                default_value=False,
-                type=bool,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="USE_DB_HISTORY",
-                value=False,
-                help="是否尝试从数据库(chat_history表)读取聊天记录",
-                default_value=False,
-                type=bool,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="SUMMARY_MODEL_NAME",
-                value="Gemini/gemini-2.5-flash",
-                help="默认使用的 AI 模型名称 (格式: ProviderName/ModelName)",
-                default_value="Gemini/gemini-2.5-flash",
-                type=str,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="SUMMARY_DEFAULT_STYLE",
-                value=None,
-                help="全局默认的总结风格，会被分群设置覆盖。",
-                default_value=None,
-                type=str,
-            ),
-            RegisterConfig(
-                module="summary_group",
-                key="ENABLE_AVATAR_ENHANCEMENT",
-                value=True,
-                help="是否启用头像增强功能",
-                default_value=True,
-                type=bool,
-            ),
+                key=key,
+                value=value,
+                help=help_text,
+                default_value=value,
+                type=value_type,
+            )
+            for key, value, help_text, value_type in _CONFIG_SPECS
         ],
         limits=[
             PluginCdBlock(
-                cd=60,
+                cd=_cool_down,
                 limit_type=PluginLimitType.CD,
                 watch_type=LimitWatchType.USER,
                 status=True,
@@ -237,6 +193,21 @@ __plugin_meta__ = PluginMetadata(
 )
 
 
+def _message_count_completion() -> str:
+    """总结消息数量的补全提示，按当前配置实时生成"""
+    min_length = base_config.get("SUMMARY_MIN_LENGTH", 1)
+    max_length = base_config.get("SUMMARY_MAX_LENGTH", 1000)
+    return f"输入消息数量 ({min_length}-{max_length})"
+
+
+def _target_group_option() -> Option:
+    """构造各命令共用的 -g 指定群号选项"""
+    return Option(
+        "-g",
+        Args["target_group_id", int, Field(completion="指定群号 (需要超级用户权限)")],
+    )
+
+
 summary_group = on_alconna(
     Alconna(
         "总结",
@@ -244,19 +215,14 @@ summary_group = on_alconna(
             "message_count",
             int,
             Field(
-                completion=lambda: f"输入消息数量 ({base_config.get('SUMMARY_MIN_LENGTH', 1)}-{base_config.get('SUMMARY_MAX_LENGTH', 1000)})",
+                completion=_message_count_completion,
             ),
         ],
         Option(
             "-p|--prompt",
             Args["style", str, Field(completion="指定总结风格，如：锐评, 正式")],
         ),
-        Option(
-            "-g",
-            Args[
-                "target_group_id", int, Field(completion="指定群号 (需要超级用户权限)")
-            ],
-        ),
+        _target_group_option(),
         Args[
             "parts?",
             MultiVar(At | Text),
@@ -268,9 +234,7 @@ summary_group = on_alconna(
             description="生成群聊总结",
             usage=(
                 "总结 <消息数量> [-p|--prompt 风格] [-g 群号] [@用户/内容过滤...]\n"
-                "消息数量范围: "
-                f"{base_config.get('SUMMARY_MIN_LENGTH', 1)} - "
-                f"{base_config.get('SUMMARY_MAX_LENGTH', 1000)}\n"
+                f"消息数量范围: {_min_length} - {_max_length}\n"
                 "说明: -g 仅限超级用户"
             ),
         ),
@@ -280,6 +244,9 @@ summary_group = on_alconna(
     block=True,
 )
 
+_ADMIN_RULE = admin_check("summary_group", "SUMMARY_ADMIN_LEVEL")
+"""定时总结设置/取消共用的管理员权限规则"""
+
 summary_set = on_alconna(
     Alconna(
         "定时总结",
@@ -287,21 +254,13 @@ summary_set = on_alconna(
         Args[
             "least_message_count?",
             int,
-            Field(
-                default=base_config.get("SUMMARY_MAX_LENGTH", 1000),
-                completion="输入定时总结所需的最少消息数量 (可选)",
-            ),
+            Field(completion="输入定时总结所需的最少消息数量 (可选)"),
         ],
         Option(
             "-p|--prompt",
             Args["style", str, Field(completion="指定总结风格，如：锐评, 正式 (可选)")],
         ),
-        Option(
-            "-g",
-            Args[
-                "target_group_id", int, Field(completion="指定群号 (需要超级用户权限)")
-            ],
-        ),
+        _target_group_option(),
         Option("-all", help_text="对所有群生效 (需要超级用户权限)"),
         meta=CommandMeta(
             description="设置定时群聊总结",
@@ -313,7 +272,7 @@ summary_set = on_alconna(
             compact=True,
         ),
     ),
-    rule=admin_check("summary_group", "SUMMARY_ADMIN_LEVEL"),
+    rule=_ADMIN_RULE,
     priority=5,
     block=True,
 )
@@ -322,12 +281,7 @@ summary_set = on_alconna(
 summary_remove = on_alconna(
     Alconna(
         "定时总结取消",
-        Option(
-            "-g",
-            Args[
-                "target_group_id", int, Field(completion="指定群号 (需要超级用户权限)")
-            ],
-        ),
+        _target_group_option(),
         Option("-all", help_text="取消所有群的定时总结 (需要超级用户权限)"),
         meta=CommandMeta(
             description="取消定时群聊总结",
@@ -335,7 +289,7 @@ summary_remove = on_alconna(
             example="定时总结取消\n定时总结取消 -g 123456\n定时总结取消 -all",
         ),
     ),
-    rule=admin_check("summary_group", "SUMMARY_ADMIN_LEVEL"),
+    rule=_ADMIN_RULE,
     priority=4,
     block=True,
 )
@@ -399,18 +353,49 @@ summary_config_cmd = on_alconna(
 )
 
 
-from .handlers.group_settings import (
-    handle_global_model_setting,
-    handle_global_style_setting,
-    handle_group_specific_config,
-)
-from .handlers.scheduler import (
-    handle_summary_remove as summary_remove_handler_impl,
-)
-from .handlers.scheduler import (
-    handle_summary_set as summary_set_handler_impl,
-)
-from .handlers.summary import handle_summary as summary_handler_impl
+from .utils import scheduler_tasks  # noqa: F401
+
+
+@driver.on_startup
+async def _check_summary_limits():
+    """启动时校验消息数量配置，配置错误时尽早提示而不是等到首次调用"""
+    try:
+        limits = get_summary_limits()
+    except ValueError as e:
+        logger.error(f"总结插件消息数量配置无效，总结命令将无法使用: {e}")
+        return
+    if limits.min_length > limits.max_length:
+        logger.error(
+            f"总结插件配置 SUMMARY_MIN_LENGTH ({limits.min_length}) "
+            f"大于 SUMMARY_MAX_LENGTH ({limits.max_length})，总结命令将无法使用"
+        )
+
+
+_NEED_SUPERUSER_FOR_G_MSG = "需要超级用户权限才能使用 -g 参数指定群聊。"
+_PARSE_INTERNAL_ERROR_MSG = "命令解析内部错误，请重试或联系管理员。"
+_NEED_TIME_MSG = "必须提供时间参数"
+
+
+async def _report_error(
+    target: MsgTarget,
+    command: str,
+    description: str,
+    e: Exception,
+    user_id: str,
+    group_id: int | None,
+):
+    """记录命令处理异常，并尽力将错误信息发送给用户"""
+    logger.error(
+        f"{description}: {e}",
+        command=command,
+        session=user_id,
+        group_id=group_id,
+        e=e,
+    )
+    try:
+        await UniMessage.text(f"处理命令时出错: {e!s}").send(target)
+    except Exception:
+        logger.error("发送错误消息失败", command=command)
 
 
 @summary_group.handle()
@@ -421,45 +406,47 @@ async def _(
     message_count: int,
     style: Match[str],
     parts: Match[list[At | Text]],
+    target_group_id: Match[int],
     target: MsgTarget,
 ):
-    user_id_str = event.get_user_id()
-    is_superuser = await SUPERUSER(bot, event)
-
     try:
         validate_msg_count_range(message_count)
-        logger.debug(f"消息数量 {message_count} 范围验证通过。")
     except ValueError as e:
         logger.warning(f"消息数量验证失败 (Handler): {e}")
         await UniMessage.text(str(e)).send(target)
         return
 
-    logger.debug(
-        f"用户 {user_id_str} 触发总结，权限、冷却和参数验证通过 (或为 Superuser)，开始执行核心逻辑。"
-    )
+    user_id_str = event.get_user_id()
+    group_id = event.group_id if isinstance(event, GroupMessageEvent) else None
 
-    arp = result.result
-    target_group_id_match = arp.query("g.target_group_id") if arp else None
-    if target_group_id_match and not is_superuser:
-        await UniMessage.text("需要超级用户权限才能使用 -g 参数指定群聊。").send(target)
+    target_group_id_value = (
+        target_group_id.result if target_group_id.available else None
+    )
+    # 仅在使用 -g 时才需要判断超级用户权限
+    is_superuser = target_group_id_value is not None and await SUPERUSER(bot, event)
+    if target_group_id_value is not None and not is_superuser:
+        await UniMessage.text(_NEED_SUPERUSER_FOR_G_MSG).send(target)
         logger.warning(f"用户 {user_id_str} (非超级用户) 尝试使用 -g 参数")
         return
 
+    from .handlers.summary import handle_summary as summary_handler_impl
+
     try:
         await summary_handler_impl(
-            bot, event, result, message_count, style, parts, target
+            bot,
+            event,
+            result,
+            message_count,
+            style,
+            parts,
+            target,
+            target_group_id_value,
+            is_superuser,
         )
     except Exception as e:
-        logger.error(
-            f"处理总结命令时发生异常: {e}",
-            command="总结",
-            session=event.get_user_id(),
-            group_id=getattr(event, "group_id", None),
+        await _report_error(
+            target, "总结", "处理总结命令时发生异常", e, user_id_str, group_id
         )
-        try:
-            await UniMessage.text(f"处理命令时出错: {e!s}").send(target)
-        except Exception:
-            logger.error("发送错误消息失败", command="总结")
 
 
 @summary_set.handle()
@@ -467,35 +454,34 @@ async def _(
     bot: Bot,
     event: GroupMessageEvent | PrivateMessageEvent,
     result: CommandResult,
+    time_str: Match[str],
+    least_message_count: Match[int],
+    style: Match[str],
     target: MsgTarget,
 ):
+    user_id_str = event.get_user_id()
+    group_id = event.group_id if isinstance(event, GroupMessageEvent) else None
     try:
         arp = result.result
         if not arp:
             logger.error("在 summary_set handler 中 Arparma result 为 None")
-            await UniMessage.text("命令解析内部错误，请重试或联系管理员。").send(target)
+            await UniMessage.text(_PARSE_INTERNAL_ERROR_MSG).send(target)
             return
 
-        time_str_match = arp.query("time_str")
-        least_count_match = arp.query("least_message_count")
+        style_value = style.result if style.available else None
 
-        style_value = arp.query("p.style")
-        if style_value is None:
-            style_value = arp.query("prompt.style")
-        logger.debug(f"使用 arp.query 提取的 style_value: {style_value!r}")
-
-        if not time_str_match:
-            await UniMessage.text("必须提供时间参数").send(target)
+        if not time_str.available or not time_str.result:
+            await UniMessage.text(_NEED_TIME_MSG).send(target)
             return
 
         try:
-            time_tuple = parse_and_validate_time(time_str_match)
+            time_tuple = parse_and_validate_time(time_str.result)
 
-            default_count = base_config.get("SUMMARY_MAX_LENGTH")
-            count_to_validate = (
-                least_count_match if least_count_match is not None else default_count
+            least_count = validate_msg_count_range(
+                least_message_count.result
+                if least_message_count.available
+                else get_summary_limits().max_length
             )
-            least_count = validate_msg_count_range(int(count_to_validate))
 
         except ValueError as e:
             await UniMessage.text(str(e)).send(target)
@@ -505,21 +491,20 @@ async def _(
             await UniMessage.text(f"解析时间或数量时出错: {e}").send(target)
             return
 
+        from .handlers.scheduler import handle_summary_set as summary_set_handler_impl
+
         await summary_set_handler_impl(
             bot, event, result, time_tuple, least_count, style_value, target
         )
     except Exception as e:
-        logger.error(
-            f"处理定时总结设置命令时发生异常: {e}",
-            command="定时总结",
-            session=event.get_user_id(),
-            group_id=getattr(event, "group_id", None),
-            e=e,
+        await _report_error(
+            target,
+            "定时总结",
+            "处理定时总结设置命令时发生异常",
+            e,
+            user_id_str,
+            group_id,
         )
-        try:
-            await UniMessage.text(f"处理命令时出错: {e!s}").send(target)
-        except Exception:
-            logger.error("发送错误消息失败", command="定时总结")
 
 
 @summary_remove.handle()
@@ -529,6 +514,10 @@ async def _(
     result: CommandResult,
     target: MsgTarget,
 ):
+    from .handlers.scheduler import (
+        handle_summary_remove as summary_remove_handler_impl,
+    )
+
     await summary_remove_handler_impl(bot, event, result, target)
 
 
@@ -538,6 +527,8 @@ async def _(
     target: MsgTarget,
     result: CommandResult,
 ):
+    from .handlers.group_settings import handle_global_model_setting
+
     await handle_global_model_setting(event.get_user_id(), target, result)
 
 
@@ -547,6 +538,8 @@ async def _(
     target: MsgTarget,
     result: CommandResult,
 ):
+    from .handlers.group_settings import handle_global_style_setting
+
     await handle_global_style_setting(event.get_user_id(), target, result)
 
 
@@ -557,4 +550,6 @@ async def _(
     target: MsgTarget,
     result: CommandResult,
 ):
+    from .handlers.group_settings import handle_group_specific_config
+
     await handle_group_specific_config(bot, event, target, result)
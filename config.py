@@ -1,4 +1,8 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+
 from zhenxun.configs.config import Config
+from zhenxun.services.log import logger
 
 base_config = Config.get("summary_group")
 
@@ -30,72 +34,116 @@ class SummaryConfig:
     @classmethod
     def get_username_max_length(cls) -> int:
         """获取用户名截断前的最大长度"""
-        return getattr(cls, "USERNAME_MAX_LENGTH", 20)
+        return cls.USERNAME_MAX_LENGTH
 
     @classmethod
     def get_user_info_timeout(cls) -> int:
         """获取用户信息超时时间"""
-        return getattr(cls, "USER_INFO_TIMEOUT", 5)
+        return cls.USER_INFO_TIMEOUT
 
     @classmethod
     def get_user_info_batch_size(cls) -> int:
         """获取用户信息批次大小"""
-        return getattr(cls, "USER_INFO_BATCH_SIZE", 10)
+        return cls.USER_INFO_BATCH_SIZE
 
     @classmethod
     def get_message_process_timeout(cls) -> int:
         """获取消息处理超时时间"""
-        return getattr(cls, "MESSAGE_PROCESS_TIMEOUT", 30)
+        return cls.MESSAGE_PROCESS_TIMEOUT
 
     @classmethod
     def get_concurrent_user_fetch_limit(cls) -> int:
         """获取并发用户信息获取限制"""
-        return getattr(cls, "CONCURRENT_USER_FETCH_LIMIT", 5)
+        return cls.CONCURRENT_USER_FETCH_LIMIT
 
     @classmethod
     def get_user_info_max_retries(cls) -> int:
         """获取用户信息最大重试次数"""
-        return getattr(cls, "USER_INFO_MAX_RETRIES", 1)
+        return cls.USER_INFO_MAX_RETRIES
 
     @classmethod
     def get_user_info_retry_delay(cls) -> float:
         """获取用户信息重试延迟"""
-        return getattr(cls, "USER_INFO_RETRY_DELAY", 0.5)
+        return cls.USER_INFO_RETRY_DELAY
 
     @classmethod
     def get_avatar_cache_size(cls) -> int:
         """获取头像缓存大小"""
-        return getattr(cls, "AVATAR_CACHE_SIZE", 100)
+        return cls.AVATAR_CACHE_SIZE
 
     @classmethod
     def get_avatar_max_count(cls) -> int:
         """获取单次处理的最大头像数量"""
-        return getattr(cls, "AVATAR_MAX_COUNT", 15)
+        return cls.AVATAR_MAX_COUNT
 
     @classmethod
     def get_avatar_cache_expire_days(cls) -> int:
         """获取头像缓存过期时间（天）"""
-        return getattr(cls, "AVATAR_CACHE_EXPIRE_DAYS", 7)
+        return cls.AVATAR_CACHE_EXPIRE_DAYS
 
     @classmethod
     def get_timeout(cls) -> int:
         """获取API请求超时时间"""
-        return getattr(cls, "TIME_OUT", 120)
+        return cls.TIME_OUT
 
     @classmethod
     def get_max_retries(cls) -> int:
         """获取API请求最大重试次数"""
-        return getattr(cls, "MAX_RETRIES", 3)
+        return cls.MAX_RETRIES
 
     @classmethod
     def get_retry_delay(cls) -> int:
         """获取API请求重试延迟时间"""
-        return getattr(cls, "RETRY_DELAY", 2)
+        return cls.RETRY_DELAY
 
     @classmethod
     def get_concurrent_tasks(cls) -> int:
         """获取同时处理总结任务的最大数量"""
-        return getattr(cls, "CONCURRENT_TASKS", 2)
+        return cls.CONCURRENT_TASKS
 
 
 summary_config = SummaryConfig()
+
+
+@dataclass(frozen=True)
+class SummaryLimits:
+    """消息数量范围的配置快照"""
+
+    min_length: int
+    max_length: int
+    range_error: str = field(init=False, repr=False)
+    """超出范围时的提示文本，随快照一同生成"""
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "range_error",
+            f"总结消息数量应在 {self.min_length} 到 {self.max_length} 之间",
+        )
+
+
+@lru_cache(maxsize=8)
+def _build_summary_limits(min_length, max_length) -> SummaryLimits:
+    """将原始配置值解析为快照，相同的配置值只解析一次"""
+    if min_length is None or max_length is None:
+        logger.error(
+            "配置缺失: SUMMARY_MIN_LENGTH 或 SUMMARY_MAX_LENGTH 未在配置中找到或为 null。"
+        )
+        raise ValueError("配置错误: 缺少最小/最大消息长度设置。")
+
+    try:
+        return SummaryLimits(
+            min_length=int(min_length),
+            max_length=int(max_length),
+        )
+    except (ValueError, TypeError):
+        logger.error("配置值 SUMMARY_MIN_LENGTH 或 SUMMARY_MAX_LENGTH 不是有效整数。")
+        raise ValueError("配置错误: 最小/最大消息长度不是有效整数。")
+
+
+def get_summary_limits() -> SummaryLimits:
+    """获取当前配置对应的快照，配置被修改后会自动得到新的快照"""
+    return _build_summary_limits(
+        base_config.get("SUMMARY_MIN_LENGTH"),
+        base_config.get("SUMMARY_MAX_LENGTH"),
+    )
@@ -1,15 +1,24 @@
-from .scheduler import (
-    handle_summary_remove,
-    handle_summary_set,
-    parse_time,
-)
-from .summary import (
-    handle_summary,
-)
+import importlib
+
+_LAZY_EXPORTS = {
+    "handle_summary": "summary",
+    "handle_summary_remove": "scheduler",
+    "handle_summary_set": "scheduler",
+}
+"""导出名称到子模块的映射，子模块在首次访问时才会被导入"""
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "handle_summary",
     "handle_summary_remove",
     "handle_summary_set",
-    "parse_time",
 ]
@@ -118,18 +118,8 @@ async def handle_group_specific_config(
         await UniMessage.text("请在群聊中操作或使用 -g <群号> 指定群组。").send(target)
         return
 
-    can_set_model = is_superuser
-    can_set_style = is_superuser
-    if not is_superuser:
-        required_level = base_config.get("SUMMARY_ADMIN_LEVEL", 10)
-        is_admin = await LevelUser.check_level(
-            user_id_str, target_group_id_str, required_level
-        )
-        if is_admin:
-            can_set_style = True
-
     if "模型" in arp.subcommands:
-        if not can_set_model:
+        if not is_superuser:
             await UniMessage.text("需要超级用户权限才能为群组设置特定模型。").send(
                 target
             )
@@ -143,7 +133,12 @@ async def handle_group_specific_config(
             await _remove_group_model(target, target_group_id_str, user_id_str)
 
     elif "风格" in arp.subcommands:
-        if not can_set_style:
+        # 仅风格设置允许群管理员操作，只在此分支查询用户等级
+        if not is_superuser and not await LevelUser.check_level(
+            user_id_str,
+            target_group_id_str,
+            base_config.get("SUMMARY_ADMIN_LEVEL", 10),
+        ):
             await UniMessage.text("需要管理员权限才能设置或移除本群风格。").send(target)
             return
 
@@ -166,29 +161,23 @@ async def _show_settings(target: MsgTarget, group_id_to_show: str):
     group_model = group_settings.get("default_model_name") if group_settings else None
     group_style = group_settings.get("default_style") if group_settings else None
 
-    message = f"群聊 {group_id_to_show} 的总结配置：\n"
-    message += "------\n"
-    message += "生效配置:\n"
-    message += f"  - 模型: {group_model or plugin_model or '未配置'}"
-    if group_model:
-        message += " (本群特定)\n"
-    else:
-        message += " (全局默认)\n"
-
-    message += f"  - 风格: {group_style or plugin_style or '无特定风格'}"
-    if group_style:
-        message += " (本群特定)\n"
-    else:
-        message += " (全局默认)\n"
-
-    message += "------\n"
-    message += "详细设置:\n"
-    message += f"  - 全局模型: {plugin_model or '未设置'}\n"
-    message += f"  - 全局风格: {plugin_style or '未设置'}\n"
-    message += f"  - 本群模型: {group_model or '未设置'}\n"
-    message += f"  - 本群风格: {group_style or '未设置'}\n"
-
-    await UniMessage.text(message.strip()).send(target)
+    model_source = "本群特定" if group_model else "全局默认"
+    style_source = "本群特定" if group_style else "全局默认"
+    lines = [
+        f"群聊 {group_id_to_show} 的总结配置：",
+        "------",
+        "生效配置:",
+        f"  - 模型: {group_model or plugin_model or '未配置'} ({model_source})",
+        f"  - 风格: {group_style or plugin_style or '无特定风格'} ({style_source})",
+        "------",
+        "详细设置:",
+        f"  - 全局模型: {plugin_model or '未设置'}",
+        f"  - 全局风格: {plugin_style or '未设置'}",
+        f"  - 本群模型: {group_model or '未设置'}",
+        f"  - 本群风格: {group_style or '未设置'}",
+    ]
+
+    await UniMessage.text("\n".join(lines)).send(target)
 
 
 async def _set_group_model(
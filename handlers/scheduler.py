@@ -3,69 +3,9 @@ from nonebot.permission import SUPERUSER
 from nonebot_plugin_alconna import CommandResult
 from nonebot_plugin_alconna.uniseg import MsgTarget, UniMessage
 
-from zhenxun.services.log import logger
 from zhenxun.services.scheduler import scheduler_manager
 
 
-def parse_time(time_str: str) -> tuple[int, int]:
-    logger.debug(f"parse_time called with input: {time_str!r}")
-
-    if not isinstance(time_str, str):
-        raise ValueError(f"输入必须是字符串，而不是 {type(time_str)}")
-
-    time_str = time_str.strip()
-    if not time_str:
-        raise ValueError("时间字符串不能为空")
-
-    if ":" in time_str:
-        parts = time_str.split(":")
-        if len(parts) != 2:
-            raise ValueError("冒号格式必须为 HH:MM")
-
-        hour_str, minute_str = parts
-
-        if not (hour_str.isdigit() and minute_str.isdigit()):
-            raise ValueError("HH:MM 格式中包含非数字或空部分")
-
-        try:
-            hour = int(hour_str)
-            minute = int(minute_str)
-        except ValueError:
-            raise ValueError("无法将时间部分转换为数字")
-
-    elif time_str.isdigit():
-        if len(time_str) == 4:
-            try:
-                hour = int(time_str[:2])
-                minute = int(time_str[2:])
-            except ValueError:
-                raise ValueError("HHMM 格式解析失败")
-        elif len(time_str) == 3:
-            try:
-                hour = int(time_str[0])
-                minute = int(time_str[1:])
-            except ValueError:
-                raise ValueError("HMM 格式解析失败")
-        elif len(time_str) <= 2:
-            try:
-                hour = int(time_str)
-                minute = 0
-            except ValueError:
-                raise ValueError("H/HH 格式解析失败")
-        else:
-            raise ValueError("纯数字格式必须为 HHMM、HMM 或 H/HH")
-    else:
-        raise ValueError("时间格式无法识别，请使用 HH:MM 或 HHMM")
-
-    if not (0 <= hour <= 23):
-        raise ValueError(f"小时 {hour} 超出有效范围 (0-23)")
-    if not (0 <= minute <= 59):
-        raise ValueError(f"分钟 {minute} 超出有效范围 (0-59)")
-
-    logger.debug(f"parse_time successful: {hour:02d}:{minute:02d}")
-    return hour, minute
-
-
 async def handle_summary_set(
     bot: Bot,
     event: GroupMessageEvent | PrivateMessageEvent,
@@ -77,10 +17,12 @@ async def handle_summary_set(
 ):
     hour, minute = time_tuple
     arp = result.result
-    is_superuser = await SUPERUSER(bot, event)
-
     target_group_id_match = arp.query("g.target_group_id")
     all_enabled = arp.find("all")
+    # 仅在使用 -g / -all 时才需要判断超级用户权限
+    is_superuser = bool(target_group_id_match or all_enabled) and await SUPERUSER(
+        bot, event
+    )
 
     job_kwargs = {
         "least_message_count": least_count,
@@ -149,9 +91,12 @@ async def handle_summary_remove(
     target: MsgTarget,
 ):
     arp = result.result
-    is_superuser = await SUPERUSER(bot, event)
     target_group_id_match = arp.query("g.target_group_id")
     all_enabled = arp.find("all")
+    # 仅在使用 -g / -all 时才需要判断超级用户权限
+    is_superuser = bool(target_group_id_match or all_enabled) and await SUPERUSER(
+        bot, event
+    )
 
     if all_enabled:
         if not is_superuser:
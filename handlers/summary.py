@@ -17,18 +17,18 @@ async def handle_summary(
     style: Match[str],
     parts: Match[list[At | Text]],
     target: MsgTarget,
+    target_group_id: int | None = None,
+    is_superuser: bool | None = None,
 ):
     user_id_str = event.get_user_id()
     originating_group_id = (
         event.group_id if isinstance(event, GroupMessageEvent) else None
     )
-    is_superuser = await SUPERUSER(bot, event)
+    if target_group_id is not None and is_superuser is None:
+        is_superuser = await SUPERUSER(bot, event)
 
-    arp = result.result
-    target_group_id_match = arp.query("g.target_group_id") if arp else None
-
-    if target_group_id_match and is_superuser:
-        target_group_id_to_fetch = int(target_group_id_match)
+    if target_group_id is not None and is_superuser:
+        target_group_id_to_fetch = target_group_id
     else:
         target_group_id_to_fetch = originating_group_id
 
@@ -73,7 +73,7 @@ async def handle_summary(
 
     feedback_target_group_part = (
         f"群聊 {target_group_id_to_fetch} 的"
-        if (target_group_id_match and is_superuser)
+        if (target_group_id is not None and is_superuser)
         else "群聊"
     )
     feedback = f"正在生成{feedback_target_group_part}总结"
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from zhenxun.services.log import logger
+
+from ..config import base_config
+
+
+class TokenBucket:
+    """按每分钟请求数 (RPM) 放行请求的令牌桶"""
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self._tokens = float(rpm)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(float(self.rpm), self._tokens + elapsed * self.rpm / 60)
+        self._updated_at = now
+
+    async def acquire(self):
+        """取走一个令牌，令牌不足时按先后顺序等待补充"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait_seconds = (1 - self._tokens) * 60 / self.rpm
+                logger.debug(
+                    f"LLM 请求频率达到上限，等待 {wait_seconds:.1f} 秒",
+                    command="rate_limit",
+                )
+                await asyncio.sleep(wait_seconds)
+                self._refill()
+            self._tokens -= 1
+
+
+_buckets: dict[str | None, TokenBucket] = {}
+
+
+async def acquire_llm_rate_limit(model_name: str | None):
+    """按模型限制 LLM 请求频率，SUMMARY_LLM_RPM 为 0 时不做限制"""
+    rpm = base_config.get("SUMMARY_LLM_RPM", 0)
+    if not rpm or rpm <= 0:
+        return
+
+    bucket = _buckets.get(model_name)
+    if bucket is None or bucket.rpm != rpm:
+        bucket = _buckets[model_name] = TokenBucket(rpm)
+    await bucket.acquire()
@@ -1,4 +1,7 @@
+import asyncio
+from functools import partial
 from pathlib import Path
+import time
 
 import aiofiles
 import markdown
@@ -13,8 +16,10 @@ from zhenxun.services.llm import (
 from zhenxun.services.log import logger
 
 from .. import base_config
+from ..config import summary_config
 from ..store import store
 from .core import ErrorCode, SummaryException
+from .rate_limit import acquire_llm_rate_limit
 
 md_to_pic, html_to_pic = None, None
 if base_config.get("summary_output_type") == "image":
@@ -27,6 +32,41 @@ if base_config.get("summary_output_type") == "image":
         logger.warning(f"加载 htmlrender 失败，图片模式不可用: {e}")
 
 
+_summary_cache: dict[tuple[str | None, str, str], tuple[asyncio.Task, float]] = {}
+"""相同模型、提示词和聊天内容的总结任务缓存，进行中的请求也会被复用"""
+
+
+_llm_semaphore = asyncio.Semaphore(summary_config.get_concurrent_tasks())
+"""限制同时进行的 LLM 总结请求数量，避免突发请求触发服务商限流"""
+
+
+def _prune_summary_cache(cache_ttl: int):
+    """清理已过期的总结缓存"""
+    now = time.time()
+    expired = [k for k, (_, ts) in _summary_cache.items() if now - ts >= cache_ttl]
+    for key in expired:
+        del _summary_cache[key]
+
+
+def _evict_failed_summary(cache_key: tuple[str | None, str, str], task: asyncio.Task):
+    """总结任务失败后移除其缓存，仅当缓存中仍是该任务时才移除"""
+    if not task.cancelled() and task.exception() is None:
+        return
+    cached = _summary_cache.get(cache_key)
+    if cached and cached[0] is task:
+        del _summary_cache[cache_key]
+
+
+async def _generate_summary(
+    model_name: str | None, llm_messages: list[LLMMessage]
+) -> str:
+    await acquire_llm_rate_limit(model_name)
+    async with _llm_semaphore:
+        async with await get_model_instance(model_name) as model:
+            response = await model.generate_response(llm_messages)
+            return response.text
+
+
 async def messages_summary(
     target: MsgTarget,
     messages: list[dict[str, str]],
@@ -101,16 +141,29 @@ async def messages_summary(
         if final_model_name_str:
             logger.debug(f"使用插件默认模型: {final_model_name_str}")
 
-    try:
-        logger.info(
-            f"开始调用LLM服务进行总结，模型: {final_model_name_str or 'LLM全局默认'}"
-        )
+    cache_ttl = base_config.get("SUMMARY_RESULT_CACHE_SECONDS", 60)
+    cache_key = (final_model_name_str, final_prompt, user_content)
 
-        async with await get_model_instance(final_model_name_str) as model:
-            response = await model.generate_response(llm_messages)
-            summary_text = response.text
+    try:
+        cached = _summary_cache.get(cache_key) if cache_ttl > 0 else None
+        if cached and time.time() - cached[1] < cache_ttl:
+            logger.debug(
+                "命中总结缓存，复用相同请求的总结结果", command="messages_summary"
+            )
+            task = cached[0]
+        else:
+            logger.info(
+                f"开始调用LLM服务进行总结，模型: {final_model_name_str or 'LLM全局默认'}"
+            )
+            task = asyncio.create_task(
+                _generate_summary(final_model_name_str, llm_messages)
+            )
+            if cache_ttl > 0:
+                _prune_summary_cache(cache_ttl)
+                _summary_cache[cache_key] = (task, time.time())
+                task.add_done_callback(partial(_evict_failed_summary, cache_key))
 
-        return summary_text
+        return await asyncio.shield(task)
     except LLMException as e:
         logger.error(
             f"总结生成失败 (LLMException): {e}", command="messages_summary", e=e